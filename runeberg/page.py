@@ -2,12 +2,15 @@
 # -*- coding: utf-8 -*-
 """A runeberg.org page is a single digitized page of a work."""
 import os
+import re
 import warnings
 
 from bs4 import BeautifulSoup
 
 from runeberg.download import IMG_DIR
 
+CHAPTER_TAG = re.compile(r'<chapter\b', re.IGNORECASE)  # start of chapter tag
+
 
 class Page(object):
     """An object representing a runeberg.org page."""
@@ -111,9 +114,13 @@ class Page(object):
     def get_chapters(self):
         """Extract all chapter names on page."""
         if not hasattr(self, '_chapters'):
-            soup = BeautifulSoup(self.text, features='html5lib')
-            self._chapters = [chapter.get('name')
-                              for chapter in soup.find_all('chapter')]
+            chapters = []
+            # only parse the html if there are any chapter tags to be found
+            if CHAPTER_TAG.search(self.text):
+                soup = BeautifulSoup(self.text, features='html5lib')
+                chapters = [chapter.get('name')
+                            for chapter in soup.find_all('chapter')]
+            self._chapters = chapters
             if any(not chapter for chapter in self._chapters):
                 raise ValueError(
                     'Encountered a blank/missing chapter name on page '
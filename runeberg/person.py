@@ -73,7 +73,6 @@ class Person(object):
         @params year: years after death at which copyright expires. Defaults to
             70.
         """
-        print(datetime.now().year)
         if self.death_year and (datetime.now().year - self.death_year) > years:
             return True
         return False
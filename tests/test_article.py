@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Unit tests for article."""
 import unittest
-import unittest.mock as mock
 
 from runeberg.article import Article
 from runeberg.page import Page
@@ -55,15 +54,9 @@ class TestText(unittest.TestCase):
 
     def setUp(self):
         self.article = Article('Genesis')
-        # cannot get instance attribute mocking to work for page
         self.page = Page('page_1', text='This is the page text.')
-        self.page_range = PageRange([])
-
-        patcher = mock.patch('runeberg.page_range.PageRange.text',
-                             new_callable=mock.PropertyMock)
-        self.mock_page_range_text = patcher.start()
-        self.mock_page_range_text.return_value = 'This is the page_range text.'
-        self.addCleanup(patcher.stop)
+        self.page_range = PageRange([
+            ('page_2', Page('page_2', text='This is the page_range text.'))])
 
     def test_text_no_pages(self):
         self.assertEqual(self.article.text, '')
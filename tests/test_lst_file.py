@@ -14,6 +14,14 @@ class LstTestCase(unittest.TestCase):
         """Set up a lst_file instance."""
         self.lst_file = LstFile()
 
+    def assert_line(self, line, data, comments):
+        """Combine asserts for both data and comments."""
+        self.lst_file.parse_line(line)
+        self.assertEqual(
+            self.lst_file.data, data)
+        self.assertEqual(
+            self.lst_file.comments, comments)
+
 
 class TestLen(LstTestCase):
     """Test the __len__() method."""
@@ -21,19 +29,19 @@ class TestLen(LstTestCase):
     def test_len_no_data(self):
         """Test length of LstFile without data."""
         self.lst_file.data = []
-        self.assertEquals(len(self.lst_file), 0)
+        self.assertEqual(len(self.lst_file), 0)
 
     def test_len_no_data_but_comments(self):
         """Test length of LstFile without data but with comments."""
         self.lst_file.data = []
         self.lst_file.comments = ['a comment']
-        self.assertEquals(len(self.lst_file), 0)
+        self.assertEqual(len(self.lst_file), 0)
 
     def test_len_with_data(self):
         """Test length of LstFile with data."""
         self.lst_file.data = [i for i in range(10)]
         self.lst_file.comments = ['a comment']
-        self.assertEquals(len(self.lst_file), 10)
+        self.assertEqual(len(self.lst_file), 10)
 
 
 class TestColumns(LstTestCase):
@@ -48,7 +56,7 @@ class TestColumns(LstTestCase):
     def test_columns_single_entry(self):
         """Test columns of LstFile with a single data entry."""
         self.lst_file.data = [(1, 2, 3)]
-        self.assertEquals(self.lst_file.columns, 3)
+        self.assertEqual(self.lst_file.columns, 3)
 
     def test_columns_multiple_entries(self):
         """Test columns of LstFile with a data entries of various lengths."""
@@ -57,14 +65,14 @@ class TestColumns(LstTestCase):
             (1, 2, 3, 4),
             (1, 2)
         ]
-        self.assertEquals(self.lst_file.columns, 4)
+        self.assertEqual(self.lst_file.columns, 4)
 
     def test_columns_func_with_len(self):
         """Test columns of LstFile with _func method specifying length."""
         Test = namedtuple('Test', 'a b c d')
         self.lst_file._func = Test
         self.lst_file.data = [Test(1, 2, 3, 4)]
-        self.assertEquals(self.lst_file.columns, 4)
+        self.assertEqual(self.lst_file.columns, 4)
 
     def test_columns_func_without_len(self):
         """Test columns of LstFile with _func method not specifying length."""
@@ -78,14 +86,6 @@ class TestColumns(LstTestCase):
 class TestParseLine(LstTestCase):
     """Test the parse_line() method."""
 
-    def assert_line(self, line, data, comments):
-        """Combine asserts for both data and comments."""
-        self.lst_file.parse_line(line)
-        self.assertEquals(
-            self.lst_file.data, data)
-        self.assertEquals(
-            self.lst_file.comments, comments)
-
     # likely not the desired result
     def test_parse_line_no_data(self):
         """Test parsing an empty line."""
@@ -114,7 +114,7 @@ class TestParseLine(LstTestCase):
         self.assert_line(line, [], [])
 
 
-class TestParseLineFunc(unittest.TestCase):
+class TestParseLineFunc(LstTestCase):
     """Test the parse_line() method with _func."""
 
     def setUp(self):
@@ -122,14 +122,6 @@ class TestParseLineFunc(unittest.TestCase):
         self.func = namedtuple('Test', 'a b c d e f')
         self.lst_file = LstFile(self.func)
 
-    def assert_line(self, line, data, comments):
-        """Combine asserts for both data and comments."""
-        self.lst_file.parse_line(line)
-        self.assertEquals(
-            self.lst_file.data, data)
-        self.assertEquals(
-            self.lst_file.comments, comments)
-
     # likely not the desired result
     def test_parse_line_no_data(self):
         """Test parsing an empty line."""
@@ -167,6 +159,16 @@ class TestParseLineFunc(unittest.TestCase):
 class TestFromStream(unittest.TestCase):
     """Test from_stream() method."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.original_parse_line = LstFile.parse_line
+        cls.mock_parse_line = mock.Mock()
+        LstFile.parse_line = cls.mock_parse_line
+
+    @classmethod
+    def tearDownClass(cls):
+        LstFile.parse_line = cls.original_parse_line
+
     def setUp(self):
         self.text = (
             'a line|some values\n'
@@ -174,10 +176,7 @@ class TestFromStream(unittest.TestCase):
             'another line|some more values'
         )
         self.file_name = 'foo.lst'
-
-        patcher = mock.patch('runeberg.lst_file.LstFile.parse_line')
-        self.mock_parse_line = patcher.start()
-        self.addCleanup(patcher.stop)
+        self.mock_parse_line.reset_mock()
 
     def test_from_file_non_empty_file(self):
         result = LstFile.from_stream(self.text, self.file_name)
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Unit tests for __main__."""
 import argparse
+import builtins
 import unittest
 import unittest.mock as mock
-from collections import Sized, namedtuple
+from collections import namedtuple
+from collections.abc import Sized
 
 import runeberg.__main__ as main
 
@@ -32,25 +34,19 @@ class BaseTestCase(unittest.TestCase):
 class TestPager(unittest.TestCase):
     """Test the pager() method."""
 
-    def setUp(self):
+    mock_to_string = mock.Mock(return_value='')
 
-        patcher = mock.patch('runeberg.__main__.prompt_choice')
-        self.mock_prompt_choice = patcher.start()
-        self.addCleanup(patcher.stop)
+    def setUp(self):
+        self.mock_prompt_choice = mock.Mock()
+        self.addCleanup(setattr, main, 'prompt_choice', main.prompt_choice)
+        main.prompt_choice = self.mock_prompt_choice
 
-        self.mock_to_string = mock.Mock()
-        self.mock_to_string.return_value = ''
+        self.mock_to_string.reset_mock()
 
         self.results = []
 
-        def generator(**kwargs):
-            print('hello')
-            for r in self.results:
-                print('hello %s' % r)
-                yield r
-
         self.input_bundle = (
-            generator,
+            lambda **kwargs: iter(self.results),
             {},  # filters
             self.mock_to_string,
             'some action',
@@ -123,100 +119,54 @@ class TestPager(unittest.TestCase):
 class TestPromptChoice(unittest.TestCase):
     """Test the prompt_choice() method."""
 
-    def setUp(self):
+    # (inputs, expected result, expected number of prompts)
+    cases = (
+        (('n',), None, 1),
+        (('N',), None, 1),
+        (('foo', 'f', 'n'), None, 3),  # invalid
+        (('0', 'n'), None, 2),  # invalid int, zero
+        (('-2', 'n'), None, 2),  # invalid int, negative
+        (('5', 'n'), None, 2),  # invalid int, too large
+        (('1',), 1, 1),  # min int
+        (('4',), 4, 1),  # max int
+        (('3',), 3, 1),  # in between int
+    )
 
-        patcher = mock.patch('builtins.input')
-        self.mock_input = patcher.start()
-        self.addCleanup(patcher.stop)
+    def setUp(self):
+        self.mock_input = mock.Mock()
+        self.addCleanup(setattr, builtins, 'input', builtins.input)
+        builtins.input = self.mock_input
 
         self.input_bundle = (4, 'some action', 3)
 
-    def test_prompt_choice_q(self):
-        self.mock_input.return_value = 'q'
-        with self.assertRaises(SystemExit) as cm:
-            main.prompt_choice(*self.input_bundle)
-
-        self.mock_input.assert_called_once()
-        self.assertEqual(cm.exception.code, 0)
-
-    def test_prompt_choice_upper_q(self):
-        self.mock_input.return_value = 'Q'
-        with self.assertRaises(SystemExit) as cm:
-            main.prompt_choice(*self.input_bundle)
-
-        self.mock_input.assert_called_once()
-        self.assertEqual(cm.exception.code, 0)
-
-    def test_prompt_choice_n(self):
-        self.mock_input.return_value = 'n'
-        result = main.prompt_choice(*self.input_bundle)
+    def test_prompt_choice(self):
+        for inputs, expected, calls in self.cases:
+            with self.subTest(inputs=inputs):
+                self.mock_input.reset_mock()
+                self.mock_input.side_effect = inputs
+                result = main.prompt_choice(*self.input_bundle)
 
-        self.mock_input.assert_called_once()
-        self.assertIsNone(result)
+                self.assertEqual(self.mock_input.call_count, calls)
+                self.assertEqual(result, expected)
 
-    def test_prompt_choice_upper_n(self):
-        self.mock_input.return_value = 'N'
-        result = main.prompt_choice(*self.input_bundle)
+    def test_prompt_choice_q(self):
+        for inputs in (('q',), ('Q',)):
+            with self.subTest(inputs=inputs):
+                self.mock_input.reset_mock()
+                self.mock_input.side_effect = inputs
+                with self.assertRaises(SystemExit) as cm:
+                    main.prompt_choice(*self.input_bundle)
 
-        self.mock_input.assert_called_once()
-        self.assertIsNone(result)
+                self.mock_input.assert_called_once()
+                self.assertEqual(cm.exception.code, 0)
 
     def test_prompt_choice_n_not_allowed(self):
-        self.mock_input.side_effect = ['n', 'N', '1']
+        self.mock_input.side_effect = ('n', 'N', '1')
         result = main.prompt_choice(4, 'some action', 0)
 
         self.assertEqual(self.mock_input.call_count, 3)
         self.assertEqual(result, 1)
 
-    def test_prompt_choice_invalid(self):
-        self.mock_input.side_effect = ['foo', 'f', 'n']
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.assertEqual(self.mock_input.call_count, 3)
-        self.assertIsNone(result)
-
-    def test_prompt_choice_invalid_int_zero(self):
-        self.mock_input.side_effect = ['0', 'n']
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.assertEqual(self.mock_input.call_count, 2)
-        self.assertIsNone(result)
-
-    def test_prompt_choice_invalid_int_negative(self):
-        self.mock_input.side_effect = ['-2', 'n']
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.assertEqual(self.mock_input.call_count, 2)
-        self.assertIsNone(result)
-
-    def test_prompt_choice_invalid_int_too_large(self):
-        self.mock_input.side_effect = ['5', 'n']
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.assertEqual(self.mock_input.call_count, 2)
-        self.assertIsNone(result)
-
-    def test_prompt_choice_min_int(self):
-        self.mock_input.return_value = '1'
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.mock_input.assert_called_once()
-        self.assertEqual(result, 1)
-
-    def test_prompt_choice_max_int(self):
-        self.mock_input.return_value = '4'
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.mock_input.assert_called_once()
-        self.assertEqual(result, 4)
-
-    def test_prompt_choice_inbetween_int(self):
-        self.mock_input.return_value = '3'
-        result = main.prompt_choice(*self.input_bundle)
-
-        self.mock_input.assert_called_once()
-        self.assertEqual(result, 3)
-
 
 class TestYearRange(unittest.TestCase):
     """Test the year_range() method."""
@@ -243,6 +193,7 @@ class TestFilteredAuthorGenerator(BaseTestCase):
 
     def setUp(self):
         Author = namedtuple('Author', 'uid nationalities')
+        self.addCleanup(setattr, main, 'all_authors', main.all_authors)
         main.all_authors = {
             1: Author('none', ''),
             2: Author('one_se', 'se'),
@@ -296,6 +247,7 @@ class TestFilteredWorkGenerator(BaseTestCase):
 
     def setUp(self):
         Work = namedtuple('Work', 'uid author_uids coauthor_uids language')
+        self.addCleanup(setattr, main, 'all_works', main.all_works)
         main.all_works = {
             1: Work('none', '', '', ''),
             2: Work('one_sv', 'foo', '', 'sv'),
@@ -362,19 +314,18 @@ class TestDisplayAuthors(unittest.TestCase):
 
     def setUp(self):
         Author = namedtuple('Author', 'uid')
-        patcher = mock.patch('runeberg.__main__.pager')
-        self.mock_pager = patcher.start()
-        self.mock_pager.return_value = Author('foo')
-        self.addCleanup(patcher.stop)
+        self.mock_pager = mock.Mock(return_value=Author('foo'))
+        self.addCleanup(setattr, main, 'pager', main.pager)
+        main.pager = self.mock_pager
 
-        patcher = mock.patch('runeberg.__main__.display_works')
-        self.mock_display_works = patcher.start()
-        self.mock_display_works.return_value = 'bar'
-        self.addCleanup(patcher.stop)
+        self.mock_display_works = mock.Mock(return_value='bar')
+        self.addCleanup(setattr, main, 'display_works', main.display_works)
+        main.display_works = self.mock_display_works
 
-        patcher = mock.patch('runeberg.__main__.author_as_string')
-        self.mock_author_as_string = patcher.start()
-        self.addCleanup(patcher.stop)
+        self.mock_author_as_string = mock.Mock()
+        self.addCleanup(
+            setattr, main, 'author_as_string', main.author_as_string)
+        main.author_as_string = self.mock_author_as_string
 
     def test_display_authors_defaults(self):
         results = main.display_authors({}, 5)
@@ -428,7 +379,7 @@ class TestHandleArgs(unittest.TestCase):
     def test_handle_args_defaults(self):
         argv = []
         args = main.handle_args(argv)
-        self.assertEquals(
+        self.assertEqual(
             vars(args),
             {
                 'dir': None,
@@ -447,7 +398,7 @@ class TestHandleArgs(unittest.TestCase):
                 '--nationality', 'se',
                 '--uid', 'foo']
         args = main.handle_args(argv)
-        self.assertEquals(
+        self.assertEqual(
             vars(args),
             {
                 'dir': 'something/foo/',
@@ -465,7 +416,7 @@ class TestHandleArgs(unittest.TestCase):
         argv = ['-a',
                 '-n', '5']
         args = main.handle_args(argv)
-        self.assertEquals(
+        self.assertEqual(
             vars(args),
             {
                 'dir': None,
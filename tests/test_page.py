@@ -2,104 +2,107 @@
 """Unit tests for page."""
 import unittest
 
+import runeberg.page
 from runeberg.page import Page
 
+NO_CHAPTERS_TEXT = (
+    'row 1\n'
+    'row 2\n'
+    'row3'
+)
+UNIQUE_CHAPTERS_TEXT = (
+    'row 1\n'
+    'pre<chapter name="chp1">post\n'
+    'row 2\n'
+    'Pre<chapter name="chp2">Post\n'
+    'row3'
+)
+REPEATED_CHAPTERS_TEXT = (
+    'row 1\n'
+    'pre<chapter name="chp1">post\n'
+    'row 2\n'
+    'Pre<chapter name="chp2">Post\n'
+    'row3\n'
+    'pre<chapter name="chp1">post\n'
+)
+
+READ_ONLY_PAGE = Page('0001')
+
 
 class TestStr(unittest.TestCase):
     """Test the __str__() method."""
 
-    def setUp(self):
-        self.page = Page('0001')
-
     def test_str_range(self):
-        self.assertEqual(str(self.page), '0001')
+        self.assertEqual(str(READ_ONLY_PAGE), '0001')
 
 
 class TestGetChapters(unittest.TestCase):
     """Test the get_chapters() method."""
 
-    def setUp(self):
-        self.page = Page('0001')
-
     def test_get_chapters_empty(self):
-        self.page.text = ''
-        self.assertEqual(self.page.get_chapters(), [])
+        page = Page('0001', text='')
+        self.assertEqual(page.get_chapters(), [])
 
     def test_get_chapters_no_chapters(self):
-        self.page.text = (
-            'row 1\n'
-            'row 2\n'
-            'row3'
-        )
-        self.assertEqual(self.page.get_chapters(), [])
+        page = Page('0001', text=NO_CHAPTERS_TEXT)
+        self.assertEqual(page.get_chapters(), [])
 
     def test_get_chapters_unique_chapters(self):
-        self.page.text = (
-            'row 1\n'
-            'pre<chapter name="chp1">post\n'
-            'row 2\n'
-            'Pre<chapter name="chp2">Post\n'
-            'row3'
-        )
+        page = Page('0001', text=UNIQUE_CHAPTERS_TEXT)
         expected = ['chp1', 'chp2']
-        self.assertEqual(self.page.get_chapters(), expected)
+        self.assertEqual(page.get_chapters(), expected)
 
     def test_get_chapters_non_unique_chapters(self):
-        self.page.text = (
-            'row 1\n'
-            'pre<chapter name="chp1">post\n'
-            'row 2\n'
-            'Pre<chapter name="chp2">Post\n'
-            'row3\n'
-            'pre<chapter name="chp1">post\n'
-        )
+        page = Page('0001', text=REPEATED_CHAPTERS_TEXT)
         expected = ['chp1', 'chp2', 'chp1']
-        self.assertEqual(self.page.get_chapters(), expected)
+        self.assertEqual(page.get_chapters(), expected)
+
+    def test_get_chapters_upper_case_tag(self):
+        page = Page('0001', text='pre<CHAPTER NAME="chp1">post')
+        self.assertEqual(page.get_chapters(), ['chp1'])
+
+    def test_get_chapters_no_chapters_skips_parsing(self):
+        self.addCleanup(
+            setattr, runeberg.page, 'BeautifulSoup', runeberg.page.BeautifulSoup)
+        runeberg.page.BeautifulSoup = None  # fails if called
+
+        page = Page('0001', text=NO_CHAPTERS_TEXT)
+        self.assertEqual(page.get_chapters(), [])
+
+    def test_get_chapters_failed_parsing_not_cached(self):
+        self.addCleanup(
+            setattr, runeberg.page, 'BeautifulSoup', runeberg.page.BeautifulSoup)
+        runeberg.page.BeautifulSoup = None  # fails if called
+
+        page = Page('0001', text=UNIQUE_CHAPTERS_TEXT)
+        with self.assertRaises(TypeError):
+            page.get_chapters()
+
+        self.doCleanups()  # restore BeautifulSoup
+        self.assertEqual(page.get_chapters(), ['chp1', 'chp2'])
 
     def test_get_chapters_missing_attribute(self):
-        self.page.text = (
+        page = Page('0001', text=(
             'row 1\n'
             'pre<chapter>post\n'
             'row 2\n'
             'Pre<chapter name="chp2">Post\n'
-        )
+        ))
         with self.assertRaises(ValueError):
-            self.page.get_chapters()
+            page.get_chapters()
 
 
 class TestRenameChapter(unittest.TestCase):
     """Test the rename_chapter() method."""
 
-    def setUp(self):
-        text = (
-            'row 1\n'
-            'row 2\n'
-            'row3'
-        )
-        self.page = Page('0001', text=text)
-
     def test_rename_chapter_no_chapter(self):
-        self.page.text = (
-            'row 1\n'
-            'row 2\n'
-            'row3'
-        )
-        expected = (
-            'row 1\n'
-            'row 2\n'
-            'row3'
-        )
-        self.page.rename_chapter('chp1', 'foo')
-        self.assertEqual(self.page.text, expected)
+        page = Page('0001', text=NO_CHAPTERS_TEXT)
+        expected = NO_CHAPTERS_TEXT
+        page.rename_chapter('chp1', 'foo')
+        self.assertEqual(page.text, expected)
 
     def test_rename_chapter_single_match(self):
-        self.page.text = (
-            'row 1\n'
-            'pre<chapter name="chp1">post\n'
-            'row 2\n'
-            'Pre<chapter name="chp2">Post\n'
-            'row3'
-        )
+        page = Page('0001', text=UNIQUE_CHAPTERS_TEXT)
         expected = (
             'row 1\n'
             'pre<chapter name="chp1">post\n'
@@ -107,18 +110,11 @@ class TestRenameChapter(unittest.TestCase):
             'Pre<chapter name="foo">Post\n'
             'row3'
         )
-        self.page.rename_chapter('chp2', 'foo')
-        self.assertEqual(self.page.text, expected)
+        page.rename_chapter('chp2', 'foo')
+        self.assertEqual(page.text, expected)
 
     def test_rename_chapter_multiple_matches(self):
-        self.page.text = (
-            'row 1\n'
-            'pre<chapter name="chp1">post\n'
-            'row 2\n'
-            'Pre<chapter name="chp2">Post\n'
-            'row3\n'
-            'pre<chapter name="chp1">post\n'
-        )
+        page = Page('0001', text=REPEATED_CHAPTERS_TEXT)
         expected = (
             'row 1\n'
             'pre<chapter name="foo">post\n'
@@ -127,98 +123,82 @@ class TestRenameChapter(unittest.TestCase):
             'row3\n'
             'pre<chapter name="chp1">post\n'
         )
-        self.page.rename_chapter('chp1', 'foo')
-        self.assertEqual(self.page.text, expected)
+        page.rename_chapter('chp1', 'foo')
+        self.assertEqual(page.text, expected)
 
 
 class TestCheckBlank(unittest.TestCase):
     """Test the check_blank() method."""
 
-    def setUp(self):
-        text = (
-            'row 1\n'
-            'row 2\n'
-            'row3'
-        )
-        self.page = Page('0001', text=text)
-
     @unittest.expectedFailure  # hack to assert not Warns
     def test_check_blank_empty_and_blank(self):
-        self.page.text = ''
-        self.page.is_proofread = None
+        page = Page('0001', text='', proofread=None)
         with self.assertWarnsRegex(UserWarning, r'is blank'):
-            self.page.check_blank()
+            page.check_blank()
 
     def test_check_blank_empty_and_proofread(self):
-        self.page.text = ''
-        self.page.is_proofread = True
+        page = Page('0001', text='', proofread=True)
         with self.assertWarnsRegex(UserWarning, r'is blank'):
-            self.page.check_blank()
+            page.check_blank()
 
     def test_check_blank_empty_and_not_proofread(self):
-        self.page.text = ''
-        self.page.is_proofread = False
+        page = Page('0001', text='', proofread=False)
         with self.assertWarnsRegex(UserWarning, r'might be blank'):
-            self.page.check_blank()
+            page.check_blank()
 
     def test_check_blank_not_empty_and_blank(self):
-        self.page.is_proofread = None
+        page = Page('0001', text=NO_CHAPTERS_TEXT, proofread=None)
         with self.assertWarnsRegex(UserWarning, r'is not empty'):
-            self.page.check_blank()
+            page.check_blank()
 
     @unittest.expectedFailure
     def test_check_blank_not_empty_and_proofread(self):
         # How to assert not Warned
-        self.page.is_proofread = True
+        page = Page('0001', text=NO_CHAPTERS_TEXT, proofread=True)
         with self.assertWarnsRegex(UserWarning, r'is not empty'):
-            self.page.check_blank()
+            page.check_blank()
 
     @unittest.expectedFailure
     def test_check_blank_not_empty_and_not_proofread(self):
         # How to assert not Warned
-        self.page.is_proofread = False
+        page = Page('0001', text=NO_CHAPTERS_TEXT, proofread=False)
         with self.assertWarnsRegex(UserWarning, r'is not empty'):
-            self.page.check_blank()
+            page.check_blank()
 
 
 class TestSetBlank(unittest.TestCase):
     """Test the set_blank() method."""
 
     def setUp(self):
-        self.page = Page('0001')
-        self.page.is_proofread = False
+        self.page = Page('0001', proofread=False)
 
     def test_set_blank_empty_label(self):
         # self.page.label = ''
         self.page.set_blank()
-        self.assertEquals(self.page.label, '')
+        self.assertEqual(self.page.label, '')
         self.assertFalse(self.page.is_proofread)
 
     def test_set_blank_non_blank_label(self):
         self.page.label = 'foo'
 
         self.page.set_blank()
-        self.assertEquals(self.page.label, 'foo')
+        self.assertEqual(self.page.label, 'foo')
         self.assertFalse(self.page.is_proofread)
 
     def test_set_blank_blank_label(self):
         self.page.label = '(blank)'
 
         self.page.set_blank()
-        self.assertEquals(self.page.label, Page.DEFAULT_BLANK)
+        self.assertEqual(self.page.label, Page.DEFAULT_BLANK)
         self.assertIsNone(self.page.is_proofread)
 
 
 class TestImageFileType(unittest.TestCase):
     """Test the image_file_type() method."""
 
-    def setUp(self):
-        self.page = Page('0001')
-
     def test_image_file_type_empty(self):
-        # self.page.image = ''
-        self.assertIsNone(self.page.image_file_type)
+        self.assertIsNone(READ_ONLY_PAGE.image_file_type)
 
     def test_image_file_type_tif(self):
-        self.page.image = 'somewhere/foo.tif'
-        self.assertEquals(self.page.image_file_type, '.tif')
+        page = Page('0001', image='somewhere/foo.tif')
+        self.assertEqual(page.image_file_type, '.tif')
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 """Unit tests for person."""
 import unittest
-import unittest.mock as mock
 from datetime import date
+from types import SimpleNamespace
 
+import runeberg.person as person
 from runeberg.person import Person
 
 
@@ -24,16 +25,21 @@ class TestName(unittest.TestCase):
 class TestIsPd(unittest.TestCase):
     """Test the is_pd() method."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Replace `runeberg.person.datetime` with a fixed-date stub."""
+        cls._datetime = person.datetime
+        person.datetime = SimpleNamespace(now=lambda: date(2020, 6, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore `runeberg.person.datetime`."""
+        person.datetime = cls._datetime
+
     def setUp(self):
-        """Set up person class and mocks."""
+        """Set up person class."""
         self.person = Person(1, 'McTestFace')
 
-        # mocking the builtin datetime
-        patcher = mock.patch('runeberg.person.datetime')
-        self.mock_datetime = patcher.start()
-        self.mock_datetime.now.return_value = date(2020, 6, 1)
-        self.addCleanup(patcher.stop)
-
     def test_is_pd_no_date(self):
         """Test person without a death date."""
         self.person.death_year = None
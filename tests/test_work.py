@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 """Unit tests for work."""
+import copy
 import unittest
 import unittest.mock as mock
 from collections import Counter, OrderedDict
+from contextlib import ExitStack
+from types import SimpleNamespace
 
 from runeberg.article import Article
 from runeberg.page import Page
@@ -19,6 +22,8 @@ from runeberg.work import (
 class PseudoDirEntry(object):
     """Class to mock DirEntry returned by os.scandir."""
 
+    __slots__ = ('name', 'path', '_is_file')
+
     def __init__(self, name, is_file=True):
         """Initialise a PseudoDirEntry."""
         self.name = name
@@ -34,14 +39,101 @@ class PseudoDirEntry(object):
         return self.path
 
 
+class PseudoScandirIterator(list):
+    """List of entries mocking the iterator returned by os.scandir."""
+
+    def __enter__(self):
+        """Fake entering the context."""
+        return self
+
+    def __exit__(self, *args):
+        """Fake closing the iterator."""
+
+
+class StubPage(Page):
+    """Page recording chapter renames and returning preset chapters."""
+
+    def __init__(self, *args, chapters=None, **kwargs):
+        """Initialise a StubPage with the chapters it should report."""
+        super().__init__(*args, **kwargs)
+        self.chapters = chapters or []
+        self.renamed = []
+
+    def get_chapters(self):
+        """Return the preset chapters."""
+        return self.chapters
+
+    def rename_chapter(self, old_name, new_name):
+        """Record the rename instead of performing it."""
+        self.renamed.append((old_name, new_name))
+
+
+class PatchedTestCase(unittest.TestCase):
+    """
+    Start the patches listed in PATCHES once for the whole class.
+
+    The resulting mocks are found in self.mocks under the name of the patched
+    attribute and are reset, incl. return values, before each test.
+    """
+
+    PATCHES = ()  # dotted paths of the attributes to replace with a Mock
+
+    @classmethod
+    def setUpClass(cls):
+        # any patches already started are undone if a later one fails
+        with ExitStack() as stack:
+            # cannot autospec due to https://bugs.python.org/issue23078
+            cls.mocks = {
+                target.rpartition('.')[2]: stack.enter_context(
+                    mock.patch(target, new_callable=mock.Mock))
+                for target in cls.PATCHES}
+            cls.patches = stack.pop_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.patches.close()
+
+    def setUp(self):
+        for mocked in self.mocks.values():
+            mocked.reset_mock(return_value=True, side_effect=True)
+
+
+# Fixtures which the code under test only reads are built once, here or in
+# setUpClass, and shared between tests. Never modify them in a test.
+METADATA_LINES = (
+    'CHARSET: utf-8',
+    'TITLEKEY: test',
+    'FOO: bar'
+)
+EXPECTED_METADATA = {
+    'CHARSET': 'utf-8',
+    'TITLEKEY': 'test',
+    'FOO': 'bar'
+}
+EMPTY_COUNTER = Counter()
+SCANDIR_ENTRIES = (
+    PseudoDirEntry('.git', False),
+    PseudoDirEntry('.travis.yml'),
+    PseudoDirEntry('tests', False)
+)
+
+
 class TestParseRange(unittest.TestCase):
     """Unit tests for parse_range."""
 
-    def setUp(self):
-        self.work = Work('test')
-        self.work.pages = PageRange([
+    @classmethod
+    def setUpClass(cls):
+        cls.work = Work('test')
+        cls.work.pages = PageRange([
+            ('one', 3),
+            ('two', 2),
+            ('three', 1),
+            ('four', 0)])
+        cls.expected_one_three = PageRange([
             ('one', 3),
             ('two', 2),
+            ('three', 1)])
+        cls.expected_three_four = PageRange([
             ('three', 1),
             ('four', 0)])
 
@@ -56,49 +148,42 @@ class TestParseRange(unittest.TestCase):
     def test_parse_range_single_range(self):
         page_range = 'one-three'
         self.assertEqual(
-            self.work.parse_range(page_range),
-            [PageRange([
-                ('one', 3),
-                ('two', 2),
-                ('three', 1)])])
+            self.work.parse_range(page_range), [self.expected_one_three])
 
     def test_parse_range_multiple_mixed(self):
         page_range = 'one three-four'
         self.assertEqual(
-            self.work.parse_range(page_range),
-            [
-                3,
-                PageRange([
-                    ('three', 1),
-                    ('four', 0)])
-            ])
+            self.work.parse_range(page_range), [3, self.expected_three_four])
 
 
-class TestLoadMetadata(unittest.TestCase):
-    """Unit tests for load_metadata."""
+class TestLoadMetadataEmpty(PatchedTestCase):
+    """Unit tests for load_metadata without any metadata lines."""
+
+    PATCHES = ('runeberg.work.Work.read_metadata',)
 
     def setUp(self):
+        super().setUp()
         self.work = Work('test')
-        # cannot autospec due to https://bugs.python.org/issue23078
-        patcher = mock.patch('runeberg.work.Work.read_metadata')
-        self.mock_read_metadata = patcher.start()
-        self.mock_read_metadata.return_value = [
-            'CHARSET: utf-8',
-            'TITLEKEY: test',
-            'FOO: bar'
-        ]
-        self.expected = {
-            'CHARSET': 'utf-8',
-            'TITLEKEY': 'test',
-            'FOO': 'bar'
-        }
-        self.addCleanup(patcher.stop)
+        self.mocks['read_metadata'].return_value = []
 
     def test_load_metadata_empty(self):
-        self.mock_read_metadata.return_value = []
         with self.assertRaises(NotImplementedError):  # unsupported charset
             self.work.load_metadata('path')
 
+
+class TestLoadMetadata(PatchedTestCase):
+    """Unit tests for load_metadata."""
+
+    PATCHES = ('runeberg.work.Work.read_metadata',)
+
+    def setUp(self):
+        super().setUp()
+        self.work = Work('test')
+        self.mock_read_metadata = self.mocks['read_metadata']
+        # tests adding lines extend a new tuple
+        self.mock_read_metadata.return_value = METADATA_LINES
+        self.expected = EXPECTED_METADATA
+
     def test_load_metadata_set_and_overwritten_attribute(self):
         self.work.metadata = {'TEST': 'test'}
 
@@ -107,11 +192,13 @@ class TestLoadMetadata(unittest.TestCase):
         self.mock_read_metadata.assert_called_once_with('path')
 
     def test_load_metadata_ignore_comments(self):
-        self.mock_read_metadata.return_value.append('# a comment')
+        self.mock_read_metadata.return_value = METADATA_LINES + (
+            '# a comment',)
         self.assertEqual(self.work.load_metadata('path'), self.expected)
 
     def test_load_metadata_detect_invalid_line(self):
-        self.mock_read_metadata.return_value.append('an invalid line')
+        self.mock_read_metadata.return_value = METADATA_LINES + (
+            'an invalid line',)
         with self.assertRaises(ValueError) as e:
             self.work.load_metadata('path')
             self.assertEqual(
@@ -131,17 +218,21 @@ class TestLoadMetadata(unittest.TestCase):
                 'identifier (provided: "test", found: "other_id")')
 
 
-class TestParseMarc(unittest.TestCase):
+class TestParseMarc(PatchedTestCase):
     """Unit tests for parse_marc."""
 
-    def setUp(self):
-        self.work = Work('test')
-        self.work.metadata = {'MARC': 'some_data'}
+    PATCHES = ('runeberg.work.Work.parse_multivalued_mappings',)
 
-        patcher = mock.patch('runeberg.work.Work.parse_multivalued_mappings')
-        self.mock_parse_multivalued = patcher.start()
+    @classmethod
+    def setUpClass(cls):
+        cls.work = Work('test')
+        cls.work.metadata = {'MARC': 'some_data'}
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self.mock_parse_multivalued = self.mocks['parse_multivalued_mappings']
         self.mock_parse_multivalued.return_value = 'parsed_mapping'
-        self.addCleanup(patcher.stop)
 
     def test_parse_marc(self):
         self.assertEqual(self.work.parse_marc(), 'parsed_mapping')
@@ -149,17 +240,21 @@ class TestParseMarc(unittest.TestCase):
             'some_data', 'identifiers')
 
 
-class TestParseImageSource(unittest.TestCase):
+class TestParseImageSource(PatchedTestCase):
     """Unit tests for parse_image_source."""
 
-    def setUp(self):
-        self.work = Work('test')
-        self.work.metadata = {'IMAGE_SOURCE': 'some_data'}
+    PATCHES = ('runeberg.work.Work.parse_multivalued_mappings',)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work = Work('test')
+        cls.work.metadata = {'IMAGE_SOURCE': 'some_data'}
+        super().setUpClass()
 
-        patcher = mock.patch('runeberg.work.Work.parse_multivalued_mappings')
-        self.mock_parse_multivalued = patcher.start()
+    def setUp(self):
+        super().setUp()
+        self.mock_parse_multivalued = self.mocks['parse_multivalued_mappings']
         self.mock_parse_multivalued.return_value = 'parsed_mapping'
-        self.addCleanup(patcher.stop)
 
     def test_parse_image_source(self):
         self.assertEqual(self.work.parse_image_source(), 'parsed_mapping')
@@ -170,21 +265,19 @@ class TestParseImageSource(unittest.TestCase):
 class TestParseMultivaluedMappings(unittest.TestCase):
     """Unit tests for parse_multivalued_mappings."""
 
-    def test_parse_multivalued_mappings_empty(self):
-        data = ''
-        self.assertEqual(Work.parse_multivalued_mappings(data, 'a label'), {})
+    # (data, expected)
+    cases = (
+        ('', {}),  # empty
+        ('libris:1285211', {'libris': '1285211'}),  # single
+        ('bibsys:123 rex:456', {'bibsys': '123', 'rex': '456'}),  # multiple
+    )
 
-    def test_parse_multivalued_mappings_single(self):
-        data = 'libris:1285211'
-        self.assertEqual(
-            Work.parse_multivalued_mappings(data, 'a label'),
-            {'libris': '1285211'})
-
-    def test_parse_multivalued_mappings_multiple(self):
-        data = 'bibsys:123 rex:456'
-        self.assertEqual(
-            Work.parse_multivalued_mappings(data, 'a label'),
-            {'bibsys': '123', 'rex': '456'})
+    def test_parse_multivalued_mappings(self):
+        for data, expected in self.cases:
+            with self.subTest(data=data):
+                self.assertEqual(
+                    Work.parse_multivalued_mappings(data, 'a label'),
+                    expected)
 
     def test_parse_multivalued_mappings_duplicate(self):
         data = 'bibsys:123 bibsys:456'
@@ -195,234 +288,217 @@ class TestParseMultivaluedMappings(unittest.TestCase):
 class TestSetupDisambiguationCounter(unittest.TestCase):
     """Unit tests for setup_disambiguation_counter."""
 
+    unique_chapters = Counter({'a': 1, 'b': 1, 'c': 1})
+    duplicate_chapters = Counter({'a': 1, 'b': 3, 'c': 2})
+    expected_dupes = Counter({'b': 1, 'c': 1})
+
     def test_setup_disambiguation_counter_empty(self):
-        chapters = Counter()
         self.assertEqual(
-            Work.setup_disambiguation_counter(chapters),
-            Counter())
+            Work.setup_disambiguation_counter(EMPTY_COUNTER),
+            EMPTY_COUNTER)
 
     def test_setup_disambiguation_counter_no_duplicates(self):
-        chapters = Counter(['a', 'b', 'c'])
         self.assertEqual(
-            Work.setup_disambiguation_counter(chapters),
-            Counter())
+            Work.setup_disambiguation_counter(self.unique_chapters),
+            EMPTY_COUNTER)
 
     def test_setup_disambiguation_counter_duplicates(self):
-        chapters = Counter(['a', 'b', 'c', 'b', 'b', 'c'])
         self.assertEqual(
-            Work.setup_disambiguation_counter(chapters),
-            Counter({'b': 1, 'c': 1}))
+            Work.setup_disambiguation_counter(self.duplicate_chapters),
+            self.expected_dupes)
 
 
-class TestLoadArticles(unittest.TestCase):
+class TestLoadArticles(PatchedTestCase):
     """Unit tests for load_articles."""
 
+    PATCHES = ('runeberg.lst_file.LstFile.from_file',)
+
+    @classmethod
+    def setUpClass(cls):
+        # parsing the title is slow so only do it once, then copy per test
+        cls.article_prototype = Article('A', html_name='foo')
+        cls.article_prototype.clean_title  # triggers self._clean_title
+
+        super().setUpClass()
+        # a plain static method, so swap it directly rather than patching
+        cls.patches.callback(
+            setattr, Work, 'setup_disambiguation_counter',
+            vars(Work)['setup_disambiguation_counter'])
+        cls.mock_disambiguation_counter = mock.Mock()
+        Work.setup_disambiguation_counter = cls.mock_disambiguation_counter
+
     def setUp(self):
-        self.work = Work('Foo')
+        super().setUp()
         self.base_path = 'bar'
+        self.mock_lst_file = self.mocks['from_file']
+        self.fresh_work()
 
-        # mock both the object creation and the `data` attribute
-        patcher = mock.patch('runeberg.lst_file.LstFile.from_file')
-        self.mock_lst_file = patcher.start()
-        self.mock_lst_file_data = mock.PropertyMock()
-        self.mock_lst_file.return_value = mock.MagicMock()
-        type(self.mock_lst_file.return_value).data = self.mock_lst_file_data
-        self.addCleanup(patcher.stop)
-
-        patcher = mock.patch('runeberg.work.Work.parse_range')
-        self.mock_parse_range = patcher.start()
-        self.mock_parse_range.return_value = [Page('0001', text='abc')]
-        self.addCleanup(patcher.stop)
+    def fresh_work(self):
+        """Set up the work, and the state it modifies, for a new test case."""
+        self.work = Work('Foo')
+        self.mock_disambiguation_counter.reset_mock(
+            return_value=True, side_effect=True)
 
-        patcher = mock.patch('runeberg.page.Page.rename_chapter')
-        self.mock_rename_chapter = patcher.start()
-        self.addCleanup(patcher.stop)
+        # stand-in for the LstFile, only its `data` attribute is read
+        self.lst_file = SimpleNamespace(data=[])
+        self.mock_lst_file.return_value = self.lst_file
 
-        patcher = mock.patch('runeberg.page.Page.get_chapters')
-        self.mock_get_chapters = patcher.start()
-        self.addCleanup(patcher.stop)
+        self.page = StubPage('0001', text='abc')
+        # called on the instance so it can be replaced there without patching
+        self.mock_parse_range = mock.Mock(return_value=[self.page])
+        self.work.parse_range = self.mock_parse_range
 
-        patcher = mock.patch('runeberg.work.Work.setup_disambiguation_counter')
-        self.mock_disambiguation_counter = patcher.start()
-        self.addCleanup(patcher.stop)
+    def expected_article(self, disambig=None):
+        """Create the Article expected to be loaded from the 'foo' entry."""
+        article = copy.copy(self.article_prototype)
+        article.pages = self.mock_parse_range.return_value
+        article.disambig = disambig
+        return article
 
     def test_load_articles_empty(self):
-        self.mock_lst_file_data.return_value = []
+        self.lst_file.data = []
         self.work.load_articles(self.base_path, 'chapter_counter',
                                 reconcile_chapter_tags=False)
 
-        self.assertEqual(self.work.articles, OrderedDict())
+        self.assertEqual(self.work.articles, {})
         self.mock_parse_range.assert_not_called()
-        self.mock_get_chapters.assert_not_called()
-        self.mock_rename_chapter.assert_not_called()
+        self.assertEqual(self.page.renamed, [])
 
         # don't test these further
         self.mock_lst_file.assert_called_once_with('bar/Articles.lst')
         self.mock_disambiguation_counter.assert_called_once_with(
             'chapter_counter')
 
-    def test_load_articles_one_to_one_article_chapter_tags(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '0001')]
-        self.mock_disambiguation_counter.return_value = Counter()
-        self.mock_get_chapters.return_value = ['A']
-
-        expected = Article(
-            'A', pages=self.mock_parse_range.return_value, html_name='foo')
-        expected.uid  # triggers self._clean_title
-        self.work.load_articles(self.base_path, Counter({'A': 1}))
-
-        self.assertEqual(
-            self.work.articles,
-            OrderedDict([('A', expected)]))
-        self.mock_parse_range.assert_called_once_with('0001')
-        self.mock_rename_chapter.assert_not_called()
-
-    def test_load_articles_one_to_one_article_chapter_tags_dupe(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '0001')]
-        self.mock_disambiguation_counter.return_value = Counter({'A': 1})
-        self.mock_get_chapters.return_value = ['A']
-
-        expected = Article(
-            'A', pages=self.mock_parse_range.return_value, html_name='foo',
-            disambig=1)
-        expected.uid  # triggers self._clean_title
-        self.work.load_articles(self.base_path, Counter(),
-                                reconcile_chapter_tags=False)
-
-        self.assertEqual(
-            self.work.articles,
-            OrderedDict([('A (1)', expected)]))
-        self.mock_parse_range.assert_called_once_with('0001')
-        self.mock_rename_chapter.assert_called_once_with('A', 'A (1)')
-
-    def test_load_articles_no_chapter_no_dupe(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '0001')]
-        self.mock_disambiguation_counter.return_value = Counter()
-        self.mock_get_chapters.return_value = ['B']
-
-        expected = Article(
-            'A', pages=self.mock_parse_range.return_value, html_name='foo')
-        expected.no_chapter_tag = True
-        expected.uid  # triggers self._clean_title
-        self.work.load_articles(self.base_path, Counter(),
-                                reconcile_chapter_tags=True)
-
-        self.assertEqual(
-            self.work.articles,
-            OrderedDict([('A', expected)]))
-        self.mock_parse_range.assert_called_once_with('0001')
-        self.mock_rename_chapter.assert_not_called()
+    # single article cases, where the entry is ('foo', 'A', '0001')
+    single_article_cases = (
+        dict(name='one_to_one_article_chapter_tags',
+             chapters={'A': 1}, disambiguation={}, page_chapters=['A'],
+             reconcile=True, uid='A'),
+        dict(name='one_to_one_article_chapter_tags_dupe',
+             chapters={}, disambiguation={'A': 1}, page_chapters=['A'],
+             reconcile=False, uid='A (1)', disambig=1,
+             renamed=[('A', 'A (1)')]),
+        dict(name='no_chapter_no_dupe',
+             chapters={}, disambiguation={}, page_chapters=['B'],
+             reconcile=True, uid='A', no_chapter_tag=True),
+    )
+
+    def test_load_articles_single_article(self):
+        for case in self.single_article_cases:
+            with self.subTest(name=case['name']):
+                self.fresh_work()
+                self.lst_file.data = [('foo', 'A', '0001')]
+                self.mock_disambiguation_counter.return_value = Counter(
+                    case['disambiguation'])
+                self.page.chapters = case['page_chapters']
+
+                expected = self.expected_article(disambig=case.get('disambig'))
+                expected.no_chapter_tag = case.get('no_chapter_tag')
+                self.work.load_articles(
+                    self.base_path, Counter(case['chapters']),
+                    reconcile_chapter_tags=case['reconcile'])
+
+                self.assertEqual(self.work.articles, {case['uid']: expected})
+                self.mock_parse_range.assert_called_once_with('0001')
+                self.assertEqual(self.page.renamed, case.get('renamed', []))
 
     def test_load_articles_no_chapter_no_dupe_toc(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '')]
+        self.lst_file.data = [('foo', 'A', '')]
         self.mock_disambiguation_counter.return_value = Counter()
         self.mock_parse_range.return_value = []
 
-        expected = Article(
-            'A', pages=self.mock_parse_range.return_value, html_name='foo')
+        expected = self.expected_article()
         expected.no_chapter_tag = None
-        expected.uid  # triggers self._clean_title
         self.work.load_articles(self.base_path, Counter(),
                                 reconcile_chapter_tags=True)
 
-        self.assertEqual(
-            self.work.articles,
-            OrderedDict([('A', expected)]))
+        self.assertEqual(self.work.articles, {'A': expected})
         self.mock_parse_range.assert_called_once_with('')
-        self.mock_rename_chapter.assert_not_called()
-
-    def test_load_articles_no_chapter_with_dupe_raise_error(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '0001'),
-                                                ('bar', 'A', '')]
-        self.mock_disambiguation_counter.return_value = Counter()
-        self.mock_get_chapters.return_value = []
-
-        with self.assertRaises(DisambiguationError):
-            self.work.load_articles(self.base_path, Counter(),
-                                    reconcile_chapter_tags=True)
 
-    def test_load_articles_chapter_without_article(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '0001')]
-        chapters = Counter({'B': 1})
-        self.mock_disambiguation_counter.return_value = Counter()
-        self.mock_get_chapters.return_value = []
-
-        with self.assertRaises(ReconciliationError):
-            self.work.load_articles(self.base_path, chapters,
-                                    reconcile_chapter_tags=True)
-
-    def test_load_articles_more_dupes_than_expected(self):
-        self.mock_lst_file_data.return_value = [('foo', 'A', '0001'),
-                                                ('bar', 'A', '0002'),
-                                                ('foobar', 'A', '0003')]
-        chapters = Counter({'A': 2})
-        self.mock_disambiguation_counter.return_value = Counter({'A': 1})
-        self.mock_get_chapters.return_value = ['A']
-        self.mock_parse_range.return_value = [
-            Page('0001', text='abc'),
-            Page('0002', text='abc'),
-            Page('0003', text='abc')]
-
-        with self.assertRaises(ReconciliationError):
-            self.work.load_articles(self.base_path, chapters,
-                                    reconcile_chapter_tags=True)
+    # cases raising an error, all loaded with reconcile_chapter_tags=True
+    error_cases = (
+        dict(name='no_chapter_with_dupe',
+             lst_data=[('foo', 'A', '0001'), ('bar', 'A', '')],
+             chapters={}, disambiguation={}, page_chapters=[],
+             error=DisambiguationError),
+        dict(name='chapter_without_article',
+             lst_data=[('foo', 'A', '0001')],
+             chapters={'B': 1}, disambiguation={}, page_chapters=[],
+             error=ReconciliationError),
+        dict(name='more_dupes_than_expected',
+             lst_data=[('foo', 'A', '0001'),
+                       ('bar', 'A', '0002'),
+                       ('foobar', 'A', '0003')],
+             chapters={'A': 2}, disambiguation={'A': 1}, page_chapters=['A'],
+             error=ReconciliationError),
+    )
+
+    def test_load_articles_raise_error(self):
+        for case in self.error_cases:
+            with self.subTest(name=case['name']):
+                self.fresh_work()
+                self.lst_file.data = case['lst_data']
+                self.mock_disambiguation_counter.return_value = Counter(
+                    case['disambiguation'])
+                self.page.chapters = case['page_chapters']
+
+                with self.assertRaises(case['error']):
+                    self.work.load_articles(
+                        self.base_path, Counter(case['chapters']),
+                        reconcile_chapter_tags=True)
 
 
 # @TODO: Mock Page (and Article?)
 class TestReconciliationError(unittest.TestCase):
     """Tests for list construction in ReconciliationError."""
 
+    @classmethod
+    def setUpClass(cls):
+        no_tag_article = Article('b', pages=[Page('002')])
+        no_tag_article.no_chapter_tag = True
+        cls.articles = OrderedDict([
+            ('a', Article('a', pages=[Page('001')])),
+            ('b', no_tag_article),
+            ('c', Article('c'))])
+
+    def assert_lists(self, error, unclaimed_chapters, no_tag_articles):
+        """Combine asserts for both constructed lists."""
+        self.assertEqual(error.unclaimed_chapters, unclaimed_chapters)
+        self.assertEqual(error.no_tag_articles, no_tag_articles)
+
     def test_reconciliation_error_empty(self):
-        e = ReconciliationError(Counter(), OrderedDict())
-        self.assertEqual(e.unclaimed_chapters, [])
-        self.assertEqual(e.no_tag_articles, [])
+        e = ReconciliationError(EMPTY_COUNTER, OrderedDict())
+        self.assert_lists(e, [], [])
 
     def test_reconciliation_error_non_zero_chapter_count(self):
         chapters = Counter({'a': 10, 'b': 0, 'c': 1})
         e = ReconciliationError(chapters, OrderedDict())
-        self.assertEqual(e.unclaimed_chapters, [
-            'a: 10 time(s)',
-            'c: 1 time(s)'])
-        self.assertEqual(e.no_tag_articles, [])
+        self.assert_lists(e, ['a: 10 time(s)', 'c: 1 time(s)'], [])
 
     def test_reconciliation_error_negative_chapter_count(self):
         chapters = Counter({'c': 0, 'd': -1})
         e = ReconciliationError(chapters, OrderedDict())
-        self.assertEqual(e.unclaimed_chapters, ['d: -1 time(s)'])
-        self.assertEqual(e.no_tag_articles, [])
+        self.assert_lists(e, ['d: -1 time(s)'], [])
 
     def test_reconciliation_error_articles(self):
-        a = Article('a', pages=[Page('001')])
-        b = Article('b', pages=[Page('002')])
-        b.no_chapter_tag = True
-        c = Article('c')
-        articles = OrderedDict([('a', a), ('b', b), ('c', c)])
-        e = ReconciliationError(Counter(), articles)
-        self.assertEqual(e.unclaimed_chapters, [])
-        self.assertEqual(e.no_tag_articles, [
-            'b: page(s) 002'
-        ])
-
-
-class TestDetermineImageFileType(unittest.TestCase):
+        e = ReconciliationError(EMPTY_COUNTER, self.articles)
+        self.assert_lists(e, [], ['b: page(s) 002'])
+
+
+class TestDetermineImageFileType(PatchedTestCase):
     """Unit tests for determine_image_file_type()."""
 
+    PATCHES = ('runeberg.work.os.scandir',)
+
     def setUp(self):
+        super().setUp()
         self.work = Work('test')
-        # cannot autospec due to https://bugs.python.org/issue23078
 
-        self.mock_scandir_list = [
-            PseudoDirEntry('.git', False),
-            PseudoDirEntry('.travis.yml'),
-            PseudoDirEntry('tests', False)
-        ]
+        # copy since some tests add or remove entries
+        self.mock_scandir_list = PseudoScandirIterator(SCANDIR_ENTRIES)
 
-        self.mock_scandir_val = mock.MagicMock()
-        self.mock_scandir_val.__enter__.return_value = self.mock_scandir_list
-        patcher = mock.patch('runeberg.work.os.scandir',
-                             return_value=self.mock_scandir_val)
-        self.mock_scandir = patcher.start()
-        self.addCleanup(patcher.stop)
+        self.mock_scandir = self.mocks['scandir']
+        self.mock_scandir.return_value = self.mock_scandir_list
 
     def test_determine_image_file_type_empty(self):
         del self.mock_scandir_list[:]  # empty the list without creating new
@@ -438,7 +514,7 @@ class TestDetermineImageFileType(unittest.TestCase):
         self.mock_scandir_list.append(PseudoDirEntry('tests.jpg'))
 
         self.work.determine_image_file_type('base', 'img')
-        self.assertEquals(self.work.image_type, '.jpg')
+        self.assertEqual(self.work.image_type, '.jpg')
 
     def test_determine_image_file_type_no_valid_types(self):
         self.mock_scandir_list.append(PseudoDirEntry('tests.foo'))
@@ -453,7 +529,7 @@ class TestDetermineImageFileType(unittest.TestCase):
         self.mock_scandir_list.append(PseudoDirEntry('tests.tif'))
 
         self.work.determine_image_file_type('base', 'img')
-        self.assertEquals(self.work.image_type, '.jpg')
+        self.assertEqual(self.work.image_type, '.jpg')
 
 
 class TestText(unittest.TestCase):
@@ -466,7 +542,6 @@ class TestText(unittest.TestCase):
         self.assertEqual(self.work.text, '')
 
     def test_text(self):
-        with mock.patch('runeberg.page_range.PageRange.text',
-                        new_callable=mock.PropertyMock) as mock_pagerange_text:
-            mock_pagerange_text.return_value = 'text in the page range'
-            self.assertEqual(self.work.text, 'text in the page range')
+        self.work.pages = PageRange([
+            ('0001', Page('0001', text='text in the page range'))])
+        self.assertEqual(self.work.text, 'text in the page range')